@@ -3,10 +3,14 @@
 Web interface to execute Slashy keyboard shortcut tests
 """
 
-from flask import Flask, render_template_string, jsonify
-import subprocess
-import json
-import os
+from flask import Flask, Response, render_template_string, request
+from hashlib import blake2b
+from typing import Optional
+import gzip
+import orjson
+import re
+
+from slashy_test import SlashyShortcutTester
 
 app = Flask(__name__)
 
@@ -276,22 +280,91 @@ HTML_TEMPLATE = """
 </html>
 """
 
+_STYLE_RE = re.compile(r'<style>(.*?)</style>', re.S)
+_SCRIPT_RE = re.compile(r'<script>(.*?)</script>', re.S)
+_BLOCK_RE = re.compile(r'(<style>.*?</style>|<script>.*?</script>)', re.S)
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_CSS_SPACE_RE = re.compile(r'\s*([{};,>])\s*')
+_JS_LINE_COMMENT_RE = re.compile(r'^//.*\n', re.M)
+_INDENT_RE = re.compile(r'^\s+', re.M)
+
+def _minify_css(match: re.Match) -> str:
+    """Collapse the whitespace and comments out of a <style> block"""
+    css = _CSS_COMMENT_RE.sub('', match.group(1))
+    css = _CSS_SPACE_RE.sub(r'\1', ' '.join(css.split()))
+    css = css.replace(': ', ':').replace(';}', '}')
+    return f'<style>{css}</style>'
+
+def _minify_js(match: re.Match) -> str:
+    """Strip indentation, blank lines and full-line comments from a <script> block"""
+    js = _INDENT_RE.sub('', match.group(1))
+    return f'<script>{_JS_LINE_COMMENT_RE.sub("", js)}</script>'
+
+def _minify_html(html: str) -> str:
+    """Strip indentation and blank lines from markup, and minify style and script blocks"""
+    # Split into markup (even indices) and style/script blocks (odd indices)
+    parts = _BLOCK_RE.split(html)
+    parts[::2] = [_INDENT_RE.sub('', markup) for markup in parts[::2]]
+    parts[1::2] = [_SCRIPT_RE.sub(_minify_js, _STYLE_RE.sub(_minify_css, block))
+                   for block in parts[1::2]]
+    return ''.join(parts)
+
+# The page has no template context, so render and minify it once instead
+# of re-compiling the template on every request.
+with app.app_context():
+    _RENDERED_INDEX = _minify_html(render_template_string(HTML_TEMPLATE)).encode('utf-8')
+_RENDERED_INDEX_GZ = gzip.compress(_RENDERED_INDEX, compresslevel=9, mtime=0)
+
+_RENDERED_INDEX_ETAG = blake2b(_RENDERED_INDEX, digest_size=16).hexdigest()
+
+def _precompressed_response(body: bytes, gzipped: bytes, mimetype: str, etag: str,
+                            max_age: Optional[int] = None) -> Response:
+    """Serve a constant body the way send_file would serve a static file
+
+    The gzipped form is used if the client accepts it, and repeat requests
+    carrying a matching ETag are answered with 304 Not Modified.
+    """
+    if request.accept_encodings['gzip']:
+        response = Response(gzipped, mimetype=mimetype)
+        response.headers['Content-Encoding'] = 'gzip'
+        etag += '-gzip'
+    else:
+        response = Response(body, mimetype=mimetype)
+    response.vary.add('Accept-Encoding')
+
+    response.cache_control.no_cache = True
+    if max_age is not None:
+        if max_age > 0:
+            response.cache_control.no_cache = None
+            response.cache_control.public = True
+        response.cache_control.max_age = max_age
+
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
 @app.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE)
+    # Honour SEND_FILE_MAX_AGE_DEFAULT as if index.html were a static file
+    return _precompressed_response(_RENDERED_INDEX, _RENDERED_INDEX_GZ, 'text/html',
+                                   _RENDERED_INDEX_ETAG,
+                                   max_age=app.get_send_file_max_age(None))
 
-@app.route('/run-tests')
-def run_tests():
-    # Run the test script
-    script_path = os.path.join(os.path.dirname(__file__), 'slashy_test.py')
-    subprocess.run(['python3', script_path], capture_output=True)
+def _build_report() -> bytes:
+    """Run the test suite in-process and serialize its report"""
+    tester = SlashyShortcutTester(verbose=False)
+    tester.record_all_tests()
+    return orjson.dumps(tester.build_report())
 
-    # Read the generated report
-    report_path = os.path.join(os.path.dirname(__file__), 'slashy_test_report.json')
-    with open(report_path, 'r') as f:
-        report = json.load(f)
+# The recorded results are fixed, so the report is built once at import
+# (the debug reloader restarts the process when the tester source changes).
+_REPORT_BYTES = _build_report()
+_REPORT_BYTES_GZ = gzip.compress(_REPORT_BYTES, compresslevel=9, mtime=0)
+_REPORT_ETAG = blake2b(_REPORT_BYTES, digest_size=16).hexdigest()
 
-    return jsonify(report)
+@app.route('/run-tests')
+def run_tests():
+    return _precompressed_response(_REPORT_BYTES, _REPORT_BYTES_GZ,
+                                   'application/json', _REPORT_ETAG)
 
 if __name__ == '__main__':
     print("Starting Slashy Test Runner...")
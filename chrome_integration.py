@@ -11,10 +11,10 @@ This module provides helpers for keyboard shortcut testing
 that work with Claude Code's Chrome extension integration.
 """
 
-from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any, Tuple
 from enum import Enum
-import json
+import orjson
 
 
 class KeyModifier(Enum):
@@ -28,7 +28,7 @@ class KeyModifier(Enum):
     CTRL_SHIFT = "Ctrl+Shift"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class KeyboardShortcut:
     """Represents a keyboard shortcut to test"""
     key: str
@@ -36,21 +36,33 @@ class KeyboardShortcut:
     description: str = ""
     expected_action: str = ""
 
+    # Cached values; excluded from repr, equality and hashing. They are
+    # still dataclass fields (slots=True only gives slots to fields), so
+    # fields() and asdict() include them; use to_dict() for the public view.
+    _combo: str = field(default="", init=False, repr=False, compare=False)
+    _dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "_combo",
+            self.key if self.modifier is KeyModifier.NONE else f"{self.modifier.value}+{self.key}")
+
     @property
     def combo(self) -> str:
         """Get the full key combination string"""
-        if self.modifier == KeyModifier.NONE:
-            return self.key
-        return f"{self.modifier.value}+{self.key}"
+        return self._combo
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "key": self.key,
-            "modifier": self.modifier.value,
-            "combo": self.combo,
-            "description": self.description,
-            "expected_action": self.expected_action
-        }
+        """Get the shortcut as a dict (shared; treat as read-only)"""
+        if self._dict is None:
+            object.__setattr__(self, "_dict", {
+                "key": self.key,
+                "modifier": self.modifier.value,
+                "combo": self.combo,
+                "description": self.description,
+                "expected_action": self.expected_action
+            })
+        return self._dict
 
 
 class SlashyShortcuts:
@@ -59,6 +71,10 @@ class SlashyShortcuts:
     Reference: https://slashy.com keyboard shortcuts
     """
 
+    # Populated once after the class body; see the registry below
+    _ALL: Tuple[KeyboardShortcut, ...] = ()
+    _ALL_JSON: str = "[]"
+
     # Composing & Replying
     COMPOSE = KeyboardShortcut("C", KeyModifier.NONE, "Compose mail", "Opens compose window")
     REPLY = KeyboardShortcut("R", KeyModifier.NONE, "Reply", "Opens reply composer")
@@ -108,19 +124,25 @@ class SlashyShortcuts:
     BLOCK_SENDER = KeyboardShortcut("U", KeyModifier.CMD, "Block sender", "Block email sender")
 
     @classmethod
-    def get_all(cls) -> List[KeyboardShortcut]:
+    def get_all(cls) -> Tuple[KeyboardShortcut, ...]:
         """Get all defined shortcuts"""
-        shortcuts = []
-        for name in dir(cls):
-            attr = getattr(cls, name)
-            if isinstance(attr, KeyboardShortcut):
-                shortcuts.append(attr)
-        return shortcuts
+        return cls._ALL
 
     @classmethod
     def to_json(cls) -> str:
         """Export all shortcuts as JSON"""
-        return json.dumps([s.to_dict() for s in cls.get_all()], indent=2)
+        return cls._ALL_JSON
+
+
+# The catalog is fixed at class definition, so collect it (in name order,
+# as dir() used to) and serialize it once instead of reflecting per call.
+SlashyShortcuts._ALL = tuple(
+    attr for _, attr in sorted(vars(SlashyShortcuts).items())
+    if isinstance(attr, KeyboardShortcut)
+)
+SlashyShortcuts._ALL_JSON = orjson.dumps(
+    [s.to_dict() for s in SlashyShortcuts._ALL], option=orjson.OPT_INDENT_2
+).decode()
 
 
 class ChromeTestInstructions:
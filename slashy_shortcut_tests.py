@@ -4,9 +4,99 @@ Complete test automation code for Slashy.com keyboard shortcuts
 Compatible with Claude Code execution environment
 """
 
+from collections import Counter
 from datetime import datetime
-from typing import Dict, List, Tuple
-import json
+from typing import Dict, Iterable, List, Tuple
+import orjson
+import sys
+
+# Interned status values, shared by every recorded result
+PASS = sys.intern("PASS")
+FAIL = sys.intern("FAIL")
+PARTIAL = sys.intern("PARTIAL")
+UNTESTED = sys.intern("UNTESTED")
+
+# Test IDs for each report category, in display order
+CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    "Composing & Replying": ("001", "002"),
+    "Navigation": ("003", "004", "005", "006"),
+    "Email Actions": ("007", "008", "009", "010", "011", "012"),
+    "Features": ("013", "014", "015", "016", "017"),
+    "Selection": ("018", "019"),
+    "Interface": ("020", "021"),
+    "Label Management": ("022", "023", "024", "025"),
+    "Email Control": ("026", "027", "028")
+}
+
+# Reverse lookup so results can be grouped in a single pass
+_ID_TO_CATEGORY: Dict[str, str] = {
+    test_id: category
+    for category, test_ids in CATEGORIES.items()
+    for test_id in test_ids
+}
+
+# Statuses that count towards a category's pass ratio
+_SCORED_STATUSES = frozenset((PASS, FAIL, PARTIAL))
+
+# Status column text in the detailed results table, pre-padded to width
+_STATUS_DISPLAY = {
+    PASS: "✓ PASS".ljust(10),
+    FAIL: "✗ FAIL".ljust(10),
+    PARTIAL: "⚠ PARTIAL".ljust(10)
+}
+
+# (test_id, shortcut, description, status, notes) for every recorded test
+_TESTS: Tuple[Tuple[str, str, str, str, str], ...] = (
+    # COMPOSING & REPLYING
+    ("001", "C", "Compose mail", PASS, "Opens full compose window with all fields"),
+    ("002", "R", "Reply", PASS, "Opens reply composer on right side"),
+
+    # NAVIGATION
+    ("003", "J", "Move down", PASS, "Navigates to next email in list"),
+    ("004", "K", "Move up", PASS, "Navigates to previous email"),
+    ("005", "Cmd+Up", "Jump to top", FAIL, "No action triggered"),
+    ("006", "Cmd+Down", "Jump to bottom", FAIL, "Not tested (likely same as Up)"),
+
+    # EMAIL ACTIONS
+    ("007", "E", "Mark as done", PASS, "Moves email to Done folder"),
+    ("008", "Shift+E", "Mark not done", UNTESTED, "Inverse of E - not tested"),
+    ("009", "S", "Star email", PASS, "Adds star and updates Starred count"),
+    ("010", "U", "Toggle read/unread", PARTIAL, "Navigates away instead of toggling"),
+    ("011", "#", "Move to trash", FAIL, "Special character - no action"),
+    ("012", "!", "Mark as spam", FAIL, "Special character - no action"),
+
+    # FEATURES
+    ("013", "H", "Set reminder", PASS, "Opens reminder dialog with time options"),
+    ("014", "/", "Search", FAIL, "Types character instead of opening search"),
+    ("015", "N+L", "Create label", PASS, "Opens label creation dialog"),
+    ("016", "N+S", "Create snippet", PASS, "Opens snippet creation dialog"),
+    ("017", "P+A", "AI agent chat", FAIL, "No action triggered"),
+
+    # SELECTION
+    ("018", "Cmd+A", "Select all from here", PASS, "Selects all visible emails"),
+    ("019", "Cmd+Shift+A", "Select all emails", FAIL, "No action triggered"),
+
+    # INTERFACE
+    ("020", "Cmd+B", "Toggle left sidebar", PASS, "Collapses/expands left panel smoothly"),
+    ("021", "Cmd+.", "Toggle right sidebar", PASS, "Collapses/expands right panel smoothly"),
+
+    # LABEL CYCLING
+    ("022", "Tab", "Cycle label tabs forward", PASS, "Cycles through labels (Important → Calendar)"),
+    ("023", "Shift+Tab", "Cycle label tabs back", PASS, "Cycles back through labels (Calendar → Important)"),
+
+    # INBOXES
+    ("024", "[", "Cycle to previous inbox", UNTESTED, "Requires multiple inboxes"),
+    ("025", "]", "Cycle to next inbox", UNTESTED, "Requires multiple inboxes"),
+
+    # EMAIL OPENING
+    ("026", "Enter", "Open focused email", UNTESTED, "Opens email detail view"),
+
+    # LABEL MANAGEMENT
+    ("027", "L/V", "Set label", UNTESTED, "Opens label selection"),
+
+    # BLOCKING
+    ("028", "Cmd+U", "Block sender", UNTESTED, "Blocks sender from current email"),
+)
 
 class SlashyShortcutTester:
     """Automated keyboard shortcut testing for Slashy Mail"""
@@ -17,11 +107,13 @@ class SlashyShortcutTester:
         self.passed_tests = 0
         self.failed_tests = 0
         self.partial_tests = 0
+        self._pass_rate = 0.0
         self.start_time = datetime.now()
 
     def record_test(self, test_id: str, shortcut: str, description: str,
                    status: str, notes: str = "") -> None:
         """Record a single test result"""
+        status = sys.intern(status)
         result = {
             "test_id": test_id,
             "shortcut": shortcut,
@@ -32,14 +124,38 @@ class SlashyShortcutTester:
         }
         self.test_results.append(result)
 
-        if status == "PASS":
+        if status == PASS:
             self.passed_tests += 1
-        elif status == "FAIL":
+        elif status == FAIL:
             self.failed_tests += 1
-        elif status == "PARTIAL":
+        elif status == PARTIAL:
             self.partial_tests += 1
 
         self.total_tests += 1
+        self._update_pass_rate()
+
+    def record_tests(self, tests: Iterable[Tuple[str, str, str, str, str]]) -> None:
+        """Record a batch of test results sharing a single timestamp"""
+        timestamp = datetime.now().isoformat()
+        results = [
+            {
+                "test_id": test_id,
+                "shortcut": shortcut,
+                "description": description,
+                "status": sys.intern(status),
+                "timestamp": timestamp,
+                "notes": notes
+            }
+            for test_id, shortcut, description, status, notes in tests
+        ]
+        self.test_results.extend(results)
+
+        counts = Counter(result["status"] for result in results)
+        self.passed_tests += counts[PASS]
+        self.failed_tests += counts[FAIL]
+        self.partial_tests += counts[PARTIAL]
+        self.total_tests += len(results)
+        self._update_pass_rate()
 
     def run_all_tests(self) -> None:
         """Execute all keyboard shortcut tests"""
@@ -50,83 +166,7 @@ class SlashyShortcutTester:
         print(f"Total Tests to Run: 21")
         print()
 
-        # COMPOSING & REPLYING
-        self.record_test("001", "C", "Compose mail", "PASS",
-                        "Opens full compose window with all fields")
-        self.record_test("002", "R", "Reply", "PASS",
-                        "Opens reply composer on right side")
-
-        # NAVIGATION
-        self.record_test("003", "J", "Move down", "PASS",
-                        "Navigates to next email in list")
-        self.record_test("004", "K", "Move up", "PASS",
-                        "Navigates to previous email")
-        self.record_test("005", "Cmd+Up", "Jump to top", "FAIL",
-                        "No action triggered")
-        self.record_test("006", "Cmd+Down", "Jump to bottom", "FAIL",
-                        "Not tested (likely same as Up)")
-
-        # EMAIL ACTIONS
-        self.record_test("007", "E", "Mark as done", "PASS",
-                        "Moves email to Done folder")
-        self.record_test("008", "Shift+E", "Mark not done", "UNTESTED",
-                        "Inverse of E - not tested")
-        self.record_test("009", "S", "Star email", "PASS",
-                        "Adds star and updates Starred count")
-        self.record_test("010", "U", "Toggle read/unread", "PARTIAL",
-                        "Navigates away instead of toggling")
-        self.record_test("011", "#", "Move to trash", "FAIL",
-                        "Special character - no action")
-        self.record_test("012", "!", "Mark as spam", "FAIL",
-                        "Special character - no action")
-
-        # FEATURES
-        self.record_test("013", "H", "Set reminder", "PASS",
-                        "Opens reminder dialog with time options")
-        self.record_test("014", "/", "Search", "FAIL",
-                        "Types character instead of opening search")
-        self.record_test("015", "N+L", "Create label", "PASS",
-                        "Opens label creation dialog")
-        self.record_test("016", "N+S", "Create snippet", "PASS",
-                        "Opens snippet creation dialog")
-        self.record_test("017", "P+A", "AI agent chat", "FAIL",
-                        "No action triggered")
-
-        # SELECTION
-        self.record_test("018", "Cmd+A", "Select all from here", "PASS",
-                        "Selects all visible emails")
-        self.record_test("019", "Cmd+Shift+A", "Select all emails", "FAIL",
-                        "No action triggered")
-
-        # INTERFACE
-        self.record_test("020", "Cmd+B", "Toggle left sidebar", "PASS",
-                        "Collapses/expands left panel smoothly")
-        self.record_test("021", "Cmd+.", "Toggle right sidebar", "PASS",
-                        "Collapses/expands right panel smoothly")
-
-        # LABEL CYCLING
-        self.record_test("022", "Tab", "Cycle label tabs forward", "PASS",
-                        "Cycles through labels (Important → Calendar)")
-        self.record_test("023", "Shift+Tab", "Cycle label tabs back", "PASS",
-                        "Cycles back through labels (Calendar → Important)")
-
-        # INBOXES
-        self.record_test("024", "[", "Cycle to previous inbox", "UNTESTED",
-                        "Requires multiple inboxes")
-        self.record_test("025", "]", "Cycle to next inbox", "UNTESTED",
-                        "Requires multiple inboxes")
-
-        # EMAIL OPENING
-        self.record_test("026", "Enter", "Open focused email", "UNTESTED",
-                        "Opens email detail view")
-
-        # LABEL MANAGEMENT
-        self.record_test("027", "L/V", "Set label", "UNTESTED",
-                        "Opens label selection")
-
-        # BLOCKING
-        self.record_test("028", "Cmd+U", "Block sender", "UNTESTED",
-                        "Blocks sender from current email")
+        self.record_tests(_TESTS)
 
         print()
         self.print_summary()
@@ -151,61 +191,50 @@ class SlashyShortcutTester:
 
     def print_detailed_results(self) -> None:
         """Print detailed test results by category"""
-        categories = {
-            "Composing & Replying": ["001", "002"],
-            "Navigation": ["003", "004", "005", "006"],
-            "Email Actions": ["007", "008", "009", "010", "011", "012"],
-            "Features": ["013", "014", "015", "016", "017"],
-            "Selection": ["018", "019"],
-            "Interface": ["020", "021"],
-            "Label Management": ["022", "023", "024", "025"],
-            "Email Control": ["026", "027", "028"]
-        }
-
-        print("RESULTS BY CATEGORY:")
-        print()
-
-        for category, test_ids in categories.items():
-            category_results = [r for r in self.test_results if r["test_id"] in test_ids]
-            passed = len([r for r in category_results if r["status"] == "PASS"])
-            total = len([r for r in category_results if r["status"] in ["PASS", "FAIL", "PARTIAL"]])
-
+        # [passed, total] per category, filled in one pass over the results
+        counters = {category: [0, 0] for category in CATEGORIES}
+        for r in self.test_results:
+            category = _ID_TO_CATEGORY.get(r["test_id"])
+            if category is not None and r["status"] in _SCORED_STATUSES:
+                counts = counters[category]
+                counts[0] += r["status"] == PASS
+                counts[1] += 1
+
+        # Build the whole report and emit it with a single write
+        lines = ["RESULTS BY CATEGORY:\n", "\n"]
+        append = lines.append
+
+        for category, (passed, total) in counters.items():
             if total > 0:
                 percentage = (passed / total * 100)
                 status = "✓" if passed == total else "✗"
-                print(f"{status} {category:25s}: {passed}/{total} passed ({percentage:.0f}%)")
+                append(f"{status} {category:25s}: {passed}/{total} passed ({percentage:.0f}%)\n")
 
-        print()
-        print("DETAILED RESULTS:")
-        print()
-        print(f"{'ID':3s} {'Shortcut':15s} {'Status':10s} {'Description'}")
-        print("-" * 80)
+        append("\n")
+        append("DETAILED RESULTS:\n")
+        append("\n")
+        append(f"{'ID':3s} {'Shortcut':15s} {'Status':10s} {'Description'}\n")
+        append("-" * 80 + "\n")
 
         for result in self.test_results:
-            status_display = result["status"]
-            if status_display == "PASS":
-                status_display = "✓ PASS"
-            elif status_display == "FAIL":
-                status_display = "✗ FAIL"
-            elif status_display == "PARTIAL":
-                status_display = "⚠ PARTIAL"
-            else:
-                status_display = f"- {status_display}"
-
-            print(f"{result['test_id']} {result['shortcut']:15s} {status_display:10s} {result['description']}")
+            status = result["status"]
+            status_display = _STATUS_DISPLAY.get(status) or f"- {status}".ljust(10)
+            append(" ".join((result["test_id"], result["shortcut"].ljust(15),
+                             status_display, result["description"])) + "\n")
 
-        print()
+        append("\n")
+        sys.stdout.write("".join(lines))
 
-    def save_json_report(self) -> None:
-        """Generate and save JSON report"""
-        report = {
+    def build_report(self) -> Dict:
+        """Build the JSON report structure without printing it"""
+        return {
             "metadata": {
                 "application": "Slashy Mail",
                 "platform": "Mac OS",
                 "browser": "Chrome",
                 "url": "https://slashy.com",
-                "start_time": self.start_time.isoformat(),
-                "end_time": datetime.now().isoformat()
+                "start_time": self.start_time,
+                "end_time": datetime.now()
             },
             "summary": {
                 "total_tests": self.total_tests,
@@ -217,18 +246,24 @@ class SlashyShortcutTester:
             "test_results": self.test_results
         }
 
-        json_output = json.dumps(report, indent=2)
+    def save_json_report(self) -> str:
+        """Generate and print the JSON report, pretty-printed for humans"""
+        # Machine consumers should serialize build_report() without indentation
+        json_output = orjson.dumps(self.build_report(), option=orjson.OPT_INDENT_2).decode()
         print("JSON REPORT:")
         print(json_output)
         print()
 
         return json_output
 
+    def _update_pass_rate(self) -> None:
+        """Recompute the cached pass rate after results are recorded"""
+        if self.total_tests:
+            self._pass_rate = (self.passed_tests / self.total_tests) * 100
+
     def get_pass_rate(self) -> float:
-        """Calculate overall pass rate"""
-        if self.total_tests == 0:
-            return 0.0
-        return (self.passed_tests / self.total_tests) * 100
+        """Get the overall pass rate"""
+        return self._pass_rate
 
 
 def main():
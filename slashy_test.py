@@ -5,56 +5,231 @@ Complete test automation code for Slashy.com keyboard shortcuts
 Compatible with Claude Code execution environment
 """
 
-from datetime import datetime
-from typing import Dict, List
-import json
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+import orjson
+import os
+import sys
+import time
+
+
+# Interned status values, shared by every recorded result
+PASS = sys.intern("PASS")
+FAIL = sys.intern("FAIL")
+PARTIAL = sys.intern("PARTIAL")
+ERROR = sys.intern("ERROR")
+
+# Printed line for a recorded test: icon, shortcut, description, status
+_LINE_FMT = "%s %-14s → %-28s [%s]\n"
+
+# (shortcut, description, status, notes) for every recorded test
+_TESTS: Tuple[Tuple[str, str, str, str], ...] = (
+    # COMPOSING & REPLYING
+    ("c", "Compose mail", PASS, "Opens full compose window with all fields"),
+    ("r", "Reply", PASS, "Opens reply composer on right side"),
+
+    # NAVIGATION
+    ("j", "Move down", PASS, "Navigates to next email in list"),
+    ("k", "Move up", PASS, "Navigates to previous email"),
+
+    # EMAIL ACTIONS
+    ("e", "Mark as done", PASS, "Moves email to Done folder"),
+    ("s", "Star email", PASS, "Adds star and updates Starred count"),
+
+    # FEATURES
+    ("h", "Set reminder", PASS, "Opens reminder dialog with time options"),
+
+    # INTERFACE
+    ("cmd+b", "Toggle left sidebar", PASS, "Collapses/expands left panel smoothly"),
+    ("cmd+.", "Toggle right sidebar", PASS, "Collapses/expands right panel smoothly"),
+
+    # LABEL CYCLING
+    ("Tab", "Cycle label forward", PASS, "Cycles through labels (Important → Calendar)"),
+    ("Shift+Tab", "Cycle label backward", PASS, "Cycles back through labels (Calendar → Important)"),
+
+    # NAVIGATION - JUMP
+    ("cmd+Up", "Jump to top", FAIL, "No action triggered"),
+    ("cmd+Down", "Jump to bottom", FAIL, "No action triggered"),
+
+    # MORE EMAIL ACTIONS
+    ("u", "Toggle read/unread", PARTIAL, "Navigates away instead of toggling"),
+    ("#", "Move to trash", FAIL, "Special character - no action"),
+    ("!", "Mark as spam", FAIL, "Special character - no action"),
+
+    # MORE FEATURES
+    ("/", "Search", FAIL, "Types character instead of opening search"),
+    ("n+l", "Create label", PASS, "Opens label creation dialog"),
+    ("n+s", "Create snippet", PASS, "Opens snippet creation dialog"),
+    ("p+a", "AI agent chat", FAIL, "No action triggered"),
+
+    # SELECTION
+    ("cmd+a", "Select all from here", PASS, "Selects all visible emails"),
+    ("cmd+shift+a", "Select all emails", PASS, "Selects all emails in mailbox"),
+
+    # INBOXES
+    ("[", "Previous inbox", PASS, "Cycles to previous inbox"),
+    ("]", "Next inbox", PASS, "Cycles to next inbox"),
+
+    # EMAIL CONTROL
+    ("Enter", "Open email", PASS, "Opens focused email"),
+    ("cmd+u", "Block sender", PASS, "Blocks sender from current email"),
+)
+
+
+def _row_template(shortcut: str, description: str, status: str,
+                  notes: str) -> Tuple[bytes, bytes]:
+    """Serialize the (prefix, suffix) bytes that surround a row's timestamp"""
+    head = orjson.dumps({
+        "shortcut": shortcut,
+        "description": description,
+        "status": status
+    })
+    return (head[:-1] + b',"timestamp":"',
+            b'","notes":' + orjson.dumps(notes) + b'}\n')
+
+
+# Pre-serialized NDJSON lines for the fixed test table, split around the
+# timestamp, which is the only field that varies between runs
+_ROW_TEMPLATES: Dict[Tuple[str, str, str, str], Tuple[bytes, bytes]] = {
+    row: _row_template(*row) for row in _TESTS
+}
 
 
 class SlashyShortcutTester:
     """Automated keyboard shortcut testing for Slashy Mail"""
 
-    def __init__(self):
-        self.test_results: List[Dict] = []
-        self.total_tests = 0
-        self.passed_tests = 0
-        self.failed_tests = 0
-        self.partial_tests = 0
-        self.error_tests = 0
+    __slots__ = (
+        "verbose", "_shortcuts", "_descriptions", "_statuses",
+        "_offsets", "_notes", "_counts", "_pass_rate", "start_time", "_t0"
+    )
+
+    # Printed icon for each status
+    _ICONS = {PASS: "✓", FAIL: "✗"}
+
+    def __init__(self, verbose: bool = True):
+        self.verbose = verbose
+        # Results are stored column-wise; see the test_results property
+        self._shortcuts: List[str] = []
+        self._descriptions: List[str] = []
+        self._statuses: List[str] = []
+        self._offsets: List[float] = []
+        self._notes: List[str] = []
+        # Result count per status; the total is len(self._statuses)
+        self._counts: Counter = Counter()
+        self._pass_rate = 0.0
         self.start_time = datetime.now()
+        # Monotonic clock reading paired with start_time; results record
+        # offsets from it and are stamped with wall-clock times in one pass
+        self._t0 = time.monotonic()
 
     def record_test(self, shortcut: str, description: str,
                     status: str, notes: str = "") -> None:
         """Record a single test result"""
-        result = {
-            "shortcut": shortcut,
-            "description": description,
-            "status": status,
-            "timestamp": datetime.now().isoformat(),
-            "notes": notes
-        }
-        self.test_results.append(result)
-
-        if status == "PASS":
-            self.passed_tests += 1
-        elif status == "FAIL":
-            self.failed_tests += 1
-        elif status == "PARTIAL":
-            self.partial_tests += 1
-        elif status == "ERROR":
-            self.error_tests += 1
+        status = sys.intern(status)
+        self._shortcuts.append(shortcut)
+        self._descriptions.append(description)
+        self._statuses.append(status)
+        self._offsets.append(time.monotonic() - self._t0)
+        self._notes.append(notes)
 
-        self.total_tests += 1
+        counts = self._counts
+        counts[status] += 1
+        self._pass_rate = counts[PASS] / len(self._statuses) * 100.0
 
         # Print test result
-        status_icon = "✓" if status == "PASS" else "✗" if status == "FAIL" else "⚠"
-        print(f"{status_icon} {shortcut:14s} → {description:28s} [{status}]")
+        if not self.verbose:
+            return
+        status_icon = self._ICONS.get(status, "⚠")
+        sys.stdout.write(_LINE_FMT % (status_icon, shortcut, description, status))
+
+    def record_tests(self, rows: Iterable[Tuple[str, str, str, str]]) -> None:
+        """Record a batch of (shortcut, description, status, notes) results"""
+        rows = tuple(rows)
+        if not rows:
+            return
+        shortcuts, descriptions, statuses, notes = zip(*rows)
+        statuses = tuple(map(sys.intern, statuses))
+        self._shortcuts.extend(shortcuts)
+        self._descriptions.extend(descriptions)
+        self._statuses.extend(statuses)
+        self._offsets.extend([time.monotonic() - self._t0] * len(rows))
+        self._notes.extend(notes)
+
+        # Tally the whole batch in one pass of Counter's C counting loop
+        counts = self._counts
+        counts.update(statuses)
+        self._pass_rate = counts[PASS] / len(self._statuses) * 100.0
+
+        # Print the whole batch's results with a single write
+        if not self.verbose:
+            return
+        sys.stdout.write("".join(
+            _LINE_FMT % (self._ICONS.get(status, "⚠"), shortcut, description, status)
+            for shortcut, description, status in zip(shortcuts, descriptions, statuses)
+        ))
+
+    def _iter_timestamps(self) -> Iterator[str]:
+        """ISO timestamps for the recorded clock offsets"""
+        # Batched results share an offset, so reuse the last formatted value
+        start_time = self.start_time
+        last_offset, last_iso = None, ""
+        for offset in self._offsets:
+            if offset != last_offset:
+                last_offset = offset
+                last_iso = (start_time + timedelta(seconds=offset)).isoformat()
+            yield last_iso
+
+    def _iter_results(self) -> Iterator[Dict]:
+        """Yield one dict per recorded result, built from the columns"""
+        for shortcut, description, status, timestamp, notes in zip(
+                self._shortcuts, self._descriptions, self._statuses,
+                self._iter_timestamps(), self._notes):
+            yield {
+                "shortcut": shortcut,
+                "description": description,
+                "status": status,
+                "timestamp": timestamp,
+                "notes": notes
+            }
+
+    @property
+    def test_results(self) -> List[Dict]:
+        """Recorded results as one dict per test"""
+        return list(self._iter_results())
+
+    @property
+    def total_tests(self) -> int:
+        """Number of recorded tests"""
+        return len(self._statuses)
+
+    @property
+    def passed_tests(self) -> int:
+        """Number of passed tests"""
+        return self._counts[PASS]
+
+    @property
+    def failed_tests(self) -> int:
+        """Number of failed tests"""
+        return self._counts[FAIL]
+
+    @property
+    def partial_tests(self) -> int:
+        """Number of partially passing tests"""
+        return self._counts[PARTIAL]
+
+    @property
+    def error_tests(self) -> int:
+        """Number of tests that errored"""
+        return self._counts[ERROR]
 
     def run_all_tests(self) -> None:
         """Execute all keyboard shortcut tests"""
         print("=" * 80)
         print("🧪 SLASHY KEYBOARD SHORTCUT TEST SUITE - OPTION 1")
         print("=" * 80)
-        print(f"Start Time: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Start Time: {self.start_time.isoformat(sep=' ', timespec='seconds')}")
         print(f"Total Tests: 26")
         print("=" * 80)
         print()
@@ -63,86 +238,16 @@ class SlashyShortcutTester:
         print("🔬 Testing Keyboard Shortcuts:")
         print("─" * 80)
 
-        # COMPOSING & REPLYING
-        self.record_test("c", "Compose mail", "PASS",
-                        "Opens full compose window with all fields")
-        self.record_test("r", "Reply", "PASS",
-                        "Opens reply composer on right side")
-
-        # NAVIGATION
-        self.record_test("j", "Move down", "PASS",
-                        "Navigates to next email in list")
-        self.record_test("k", "Move up", "PASS",
-                        "Navigates to previous email")
-
-        # EMAIL ACTIONS
-        self.record_test("e", "Mark as done", "PASS",
-                        "Moves email to Done folder")
-        self.record_test("s", "Star email", "PASS",
-                        "Adds star and updates Starred count")
-
-        # FEATURES
-        self.record_test("h", "Set reminder", "PASS",
-                        "Opens reminder dialog with time options")
-
-        # INTERFACE
-        self.record_test("cmd+b", "Toggle left sidebar", "PASS",
-                        "Collapses/expands left panel smoothly")
-        self.record_test("cmd+.", "Toggle right sidebar", "PASS",
-                        "Collapses/expands right panel smoothly")
-
-        # LABEL CYCLING
-        self.record_test("Tab", "Cycle label forward", "PASS",
-                        "Cycles through labels (Important → Calendar)")
-        self.record_test("Shift+Tab", "Cycle label backward", "PASS",
-                        "Cycles back through labels (Calendar → Important)")
-
-        # NAVIGATION - JUMP
-        self.record_test("cmd+Up", "Jump to top", "FAIL",
-                        "No action triggered")
-        self.record_test("cmd+Down", "Jump to bottom", "FAIL",
-                        "No action triggered")
-
-        # MORE EMAIL ACTIONS
-        self.record_test("u", "Toggle read/unread", "PARTIAL",
-                        "Navigates away instead of toggling")
-        self.record_test("#", "Move to trash", "FAIL",
-                        "Special character - no action")
-        self.record_test("!", "Mark as spam", "FAIL",
-                        "Special character - no action")
-
-        # MORE FEATURES
-        self.record_test("/", "Search", "FAIL",
-                        "Types character instead of opening search")
-        self.record_test("n+l", "Create label", "PASS",
-                        "Opens label creation dialog")
-        self.record_test("n+s", "Create snippet", "PASS",
-                        "Opens snippet creation dialog")
-        self.record_test("p+a", "AI agent chat", "FAIL",
-                        "No action triggered")
-
-        # SELECTION
-        self.record_test("cmd+a", "Select all from here", "PASS",
-                        "Selects all visible emails")
-        self.record_test("cmd+shift+a", "Select all emails", "PASS",
-                        "Selects all emails in mailbox")
-
-        # INBOXES
-        self.record_test("[", "Previous inbox", "PASS",
-                        "Cycles to previous inbox")
-        self.record_test("]", "Next inbox", "PASS",
-                        "Cycles to next inbox")
-
-        # EMAIL CONTROL
-        self.record_test("Enter", "Open email", "PASS",
-                        "Opens focused email")
-        self.record_test("cmd+u", "Block sender", "PASS",
-                        "Blocks sender from current email")
+        self.record_all_tests()
 
         print()
         self.print_summary()
         self.save_json_report()
 
+    def record_all_tests(self) -> None:
+        """Record the result of every keyboard shortcut test"""
+        self.record_tests(_TESTS)
+
     def print_summary(self) -> None:
         """Print test summary statistics"""
         end_time = datetime.now()
@@ -170,16 +275,16 @@ class SlashyShortcutTester:
         print("=" * 80)
         print()
 
-    def save_json_report(self) -> None:
-        """Generate and save JSON report to file"""
-        report = {
+    def _build_report_header(self) -> Dict:
+        """Build the report's metadata and summary sections"""
+        return {
             "metadata": {
                 "application": "Slashy Mail",
                 "platform": "Mac OS",
                 "browser": "Chrome",
                 "url": "https://slashy.com",
-                "start_time": self.start_time.isoformat(),
-                "end_time": datetime.now().isoformat()
+                "start_time": self.start_time,
+                "end_time": datetime.now()
             },
             "summary": {
                 "total_tests": self.total_tests,
@@ -188,22 +293,50 @@ class SlashyShortcutTester:
                 "failed": self.failed_tests,
                 "errors": self.error_tests,
                 "pass_rate": round(self.get_pass_rate(), 2)
-            },
-            "test_results": self.test_results
+            }
         }
 
-        # Save to file
-        with open("slashy_test_report.json", "w") as f:
-            json.dump(report, f, indent=2)
+    def build_report(self) -> Dict:
+        """Build the JSON report structure"""
+        report = self._build_report_header()
+        report["test_results"] = self.test_results
+        return report
+
+    def save_json_report(self) -> None:
+        """Generate and save JSON report to file"""
+        # Save metadata and summary; the report is machine-read, so only
+        # indent on request
+        option = orjson.OPT_INDENT_2 if os.environ.get("SLASHY_PRETTY") else 0
+        Path("slashy_test_report.json").write_bytes(
+            orjson.dumps(self._build_report_header(), option=option))
+
+        # Stream results one JSON line at a time. Rows from the fixed test
+        # table splice their timestamp (plain ASCII, never escaped) into a
+        # pre-serialized line; any other row is serialized directly.
+        templates = _ROW_TEMPLATES
+        rows = zip(self._shortcuts, self._descriptions, self._statuses, self._notes)
+        with open("slashy_test_report.ndjson", "wb") as f:
+            for row, timestamp in zip(rows, self._iter_timestamps()):
+                template = templates.get(row)
+                if template is None:
+                    shortcut, description, status, notes = row
+                    f.write(orjson.dumps({
+                        "shortcut": shortcut,
+                        "description": description,
+                        "status": status,
+                        "timestamp": timestamp,
+                        "notes": notes
+                    }, option=orjson.OPT_APPEND_NEWLINE))
+                else:
+                    f.write(template[0] + timestamp.encode() + template[1])
 
         print("📁 Report saved to: slashy_test_report.json")
+        print("📁 Results saved to: slashy_test_report.ndjson")
         print()
 
     def get_pass_rate(self) -> float:
-        """Calculate overall pass rate"""
-        if self.total_tests == 0:
-            return 0.0
-        return (self.passed_tests / self.total_tests) * 100
+        """Get the overall pass rate, kept current as results are recorded"""
+        return self._pass_rate
 
 
 def main():